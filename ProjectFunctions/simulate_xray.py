@@ -1,5 +1,90 @@
+import os
+import weakref
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
-from skimage.transform import rotate, rescale
+from skimage.transform import SimilarityTransform, radon, warp
+
+
+def _as_float32(phantom):
+    """Return phantom as float32 (no copy when it already is) so projections stream half the bytes."""
+    return np.asarray(phantom, dtype=np.float32)
+
+
+def _content_key(image):
+    """(id, crc32 of the data) for image: caches of derived arrays keyed on it miss after an in-place edit."""
+    return id(image), zlib.crc32(np.ascontiguousarray(image))
+
+
+@lru_cache(maxsize=512)
+def _rotation_matrix(shape, angle_deg):
+    """Inverse-map matrix skimage's rotate(resize=False) builds for shape and angle_deg (read-only)."""
+    rows, cols = shape
+    center = np.array((cols, rows)) / 2.0 - 0.5
+    tform = (
+        SimilarityTransform(translation=-center)
+        + SimilarityTransform(rotation=np.deg2rad(angle_deg))
+        + SimilarityTransform(translation=center)
+    )
+    matrix = tform.params
+    matrix[2] = (0, 0, 1)
+    matrix.setflags(write=False)
+    return matrix
+
+
+def _warp_source(image):
+    """image, or a writable copy of it when read-only (skimage's Cython warp rejects read-only buffers)."""
+    return image if image.flags.writeable else image.copy()
+
+
+def _rotate_edge(image, angle_deg):
+    """
+    rotate(image, angle_deg, resize=False, mode='edge') for float images, with the matrix cached per angle.
+    Order-1 edge sampling cannot leave the input range, so rotate's clip pass is skipped.
+    """
+    matrix = _rotation_matrix(image.shape, float(angle_deg))
+    return warp(_warp_source(image), matrix, order=1, mode="edge", clip=False, preserve_range=True)
+
+
+# Phantoms are looked up by id; the caches below are keyed on _content_key, so an edited phantom misses.
+_ROTATION_SOURCES = weakref.WeakValueDictionary()
+
+
+@lru_cache(maxsize=32)
+def _rotated_lru(phantom_key, angle_deg):
+    """Memoized read-only edge-mode rotation of a phantom registered in _ROTATION_SOURCES; phantom_key is its _content_key."""
+    rotated = _rotate_edge(_ROTATION_SOURCES[phantom_key[0]], angle_deg)
+    rotated.setflags(write=False)
+    return rotated
+
+
+def _register_rotation_source(phantom):
+    """Register phantom in _ROTATION_SOURCES and return its _content_key, the key of the per-phantom rotation caches."""
+    if _ROTATION_SOURCES.get(id(phantom)) is not phantom:
+        # New object (or a recycled id): entries keyed on this id may be stale.
+        _rotated_lru.cache_clear()
+        _xray_path_lru.cache_clear()
+        _ROTATION_SOURCES[id(phantom)] = phantom
+    return _content_key(phantom)
+
+
+def _rotated(phantom, angle_deg):
+    """rotate(phantom, angle_deg) reused across calls and callers; the result is shared and read-only."""
+    return _rotated_lru(_register_rotation_source(phantom), angle_deg)
+
+
+@lru_cache(maxsize=8)
+def _xray_path_lru(phantom_key, angle_deg, sid, sdd):
+    """Row-wise cumulative μ of the rotated, magnified phantom registered in _ROTATION_SOURCES (read-only)."""
+    rotated = _rotated_lru(phantom_key, angle_deg)
+    # At M=1 this is the shared rotation itself; it is only read below.
+    mag = _apply_magnification(rotated, sid, sdd)
+    path = np.cumsum(mag, axis=1)
+    path.setflags(write=False)
+    return path
+
 
 def simulate_xray_2d(
         phantom,
@@ -17,98 +102,144 @@ def simulate_xray_2d(
     filtration, exposure, and grid scaling. Params: phantom (2D μ), angle_deg, I0, sid, sdd,
     kVp, exposure_time, filtration_mmAl, grid_ratio.
     """
-    rotated = rotate(phantom, angle=angle_deg, resize=False, mode="edge")
-    nx, ny = rotated.shape
-
-    M = sdd / sid
-    mag = rescale(rotated, M, mode='edge', preserve_range=True, anti_aliasing=False)
-
-    sx, sy = mag.shape
-    out = np.zeros_like(rotated)
-    x_start = max((sx - nx) // 2, 0)
-    y_start = max((sy - ny) // 2, 0)
-    x_end = x_start + min(nx, sx)
-    y_end = y_start + min(ny, sy)
-    ox = max((nx - sx) // 2, 0)
-    oy = max((ny - sy) // 2, 0)
-    out[ox:ox + (x_end - x_start), oy:oy + (y_end - y_start)] = mag[x_start:x_end, y_start:y_end]
-    mag = out
-
-    raw_path = np.cumsum(mag, axis=1)
-    path_integral = raw_path / (ny * 0.05)
+    phantom = _as_float32(phantom)
+    # Geometry only depends on (phantom contents, angle, sid, sdd): physics-only changes reuse the cached path.
+    raw_path = _xray_path_lru(_register_rotation_source(phantom), angle_deg, sid, sdd)
+    nx, ny = raw_path.shape
 
+    # Path-length normalisation and the exponent's sign are folded into the energy scaling; this
+    # allocates the one working buffer, every later step runs in place on it.
     energy_factor = (60.0 / kVp)
-    path_integral *= energy_factor
+    I = np.multiply(raw_path, -energy_factor / (ny * 0.05))
 
     mu_al_ref = 0.12
     mu_al = mu_al_ref * (30.0 / kVp)
-    path_integral += filtration_mmAl * mu_al
+    I -= filtration_mmAl * mu_al
 
-    I = I0 * np.exp(-path_integral)
+    np.exp(I, out=I)
+    I *= _detector_gain(exposure_time * 1.2, grid_ratio, I0)
 
-    I *= (exposure_time * 1.2)
-    I = _apply_grid(I, grid_ratio)
+    return _clip_unit(I)
 
-    I = np.clip(I, 0.0, 1.0)
 
-    return I
 
 
+@lru_cache(maxsize=32)
+def _magnify_map(n, M):
+    """Offset, gather indices and weights that reproduce rescale(scale=M, order=1, mode='edge') + centre crop/pad along one axis."""
+    n_out = max(int(np.round(n * M)), 1)
+    start = max((n_out - n) // 2, 0)
+    offset = max((n - n_out) // 2, 0)
+    pos = (np.arange(min(n, n_out)) + start + 0.5) * (n / n_out) - 0.5
+    pos = np.clip(pos, 0, n - 1)
+    lo = pos.astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    # float32 weights keep the gather in the phantom's float32 instead of promoting it to float64.
+    w = (pos - lo).astype(np.float32)
+    for a in (lo, hi, w):
+        a.setflags(write=False)
+    return offset, lo, hi, w
 
 
-def _apply_magnification(image, sid, sdd):
-    """Magnify by M=sdd/sid using rescale + center crop/pad to original size."""
-    M = sdd / sid
-    if np.isclose(M, 1.0):
-        return image
-
+def _magnify(image, M):
+    """Magnify by M about the centre into the same shape, sampling only the pixels that survive the crop."""
     nx, ny = image.shape
-
-    scaled = rescale(
-        image,
-        scale=M,
-        mode='edge',
-        anti_aliasing=False,
-        preserve_range=True,
-    )
-
-    sx, sy = scaled.shape
+    ox, lox, hix, wx = _magnify_map(nx, M)
+    oy, loy, hiy, wy = _magnify_map(ny, M)
+    wx = wx[:, None]
+    rows = image[lox] * (1 - wx) + image[hix] * wx
+    window = rows[:, loy] * (1 - wy) + rows[:, hiy] * wy
+    if window.shape == image.shape:
+        return window.astype(image.dtype, copy=False)
     out = np.zeros_like(image)
+    out[ox:ox + window.shape[0], oy:oy + window.shape[1]] = window
+    return out
 
-    x_start = max((sx - nx) // 2, 0)
-    y_start = max((sy - ny) // 2, 0)
-    x_end = x_start + min(nx, sx)
-    y_end = y_start + min(ny, sy)
-
-    ox_start = max((nx - sx) // 2, 0)
-    oy_start = max((ny - sy) // 2, 0)
-    ox_end = ox_start + (x_end - x_start)
-    oy_end = oy_start + (y_end - y_start)
 
-    out[ox_start:ox_end, oy_start:oy_end] = scaled[x_start:x_end, y_start:y_end]
+# Same id-keyed scheme as the rotation cache, for magnified copies of long-lived images.
+_MAGNIFY_SOURCES = weakref.WeakValueDictionary()
 
-    return out
 
-def _apply_energy_scaling(path_integral, kVp, ref_kVp=30.0):
-    """Scale attenuation by ref_kVp/kVp (higher kVp => lower effective μ)."""
-    return path_integral * (ref_kVp / kVp)
+@lru_cache(maxsize=16)
+def _magnified_lru(image_key, M):
+    """Memoized read-only _magnify of an image registered in _MAGNIFY_SOURCES; image_key is its _content_key."""
+    mag = _magnify(_MAGNIFY_SOURCES[image_key[0]], M)
+    mag.setflags(write=False)
+    return mag
 
 
-def _apply_filtration(path_integral, filtration_mmAl, kVp):
-    """Add filtration term proportional to mm Al and inverse kVp."""
+def _apply_magnification(image, sid, sdd, cache=False):
+    """
+    Magnify by M=sdd/sid about the centre, cropped/padded to the original size.
+    With cache=True the result is memoized per (image contents, M), shared and read-only;
+    leave it off for short-lived inputs such as per-angle rotations.
+    """
+    M = sdd / sid
+    if np.isclose(M, 1.0):
+        return image
+    if not cache:
+        return _magnify(image, M)
+    if _MAGNIFY_SOURCES.get(id(image)) is not image:
+        # New object (or a recycled id): entries keyed on this id may be stale.
+        _magnified_lru.cache_clear()
+        _MAGNIFY_SOURCES[id(image)] = image
+    return _magnified_lru(_content_key(image), M)
+
+def _attenuation_exponent(path_integral, kVp, filtration_mmAl, ref_kVp=30.0, out=None):
+    """
+    Beer–Lambert exponent -(path * ref_kVp/kVp + filtration term): energy scaling (higher kVp => lower
+    effective μ) plus mm Al filtration proportional to inverse kVp, with the sign folded into the two
+    constants so no separate negate pass is needed; out as in np.multiply.
+    """
     mu_al_ref = 0.15
     mu_al = mu_al_ref * (30.0 / kVp)
     extra = filtration_mmAl * mu_al
-    return path_integral + extra
+    I = np.multiply(path_integral, -(ref_kVp / kVp), out=out)
+    return np.subtract(I, extra, out=I)
+
+
+def _detector_gain(exposure_time, grid_ratio=1.0, I0=1.0, ref_time=1.0):
+    """
+    Scalar applied after Beer–Lambert: I0, exposure (exposure_time/ref_time) and grid multiplier (<=1)
+    folded together, so the intensity buffer takes one multiply instead of one per factor.
+    """
+    return I0 * (exposure_time / ref_time) * grid_ratio
+
+
+def _clip_unit(I):
+    """Clamp I to [0, 1] in place with two plain min/max passes (np.clip's bounds handling is not needed)."""
+    np.minimum(I, 1.0, out=I)
+    return np.maximum(I, 0.0, out=I)
 
 
-def _apply_exposure(I, exposure_time, ref_time=1.0):
-    """Scale intensity by exposure_time/ref_time."""
-    return I * (exposure_time / ref_time)
+def projection_path_integral(phantom, angle_deg=None, sid=500.0, sdd=1000.0):
+    """Axis-0 line integrals of the phantom (rotated by angle_deg unless None, then magnified), before any physics."""
+    phantom = _as_float32(phantom)
+    if angle_deg is not None:
+        phantom = _rotated(phantom, angle_deg)
+    # Only the unrotated phantom is long-lived; caching per-angle rotations would evict it.
+    mag_phantom = _apply_magnification(phantom, sid, sdd, cache=angle_deg is None)
+    return np.sum(mag_phantom, axis=0)
 
-def _apply_grid(I, grid_ratio=1.0):
-    """Apply grid attenuation multiplier (<=1)."""
-    return I * grid_ratio
+
+def apply_projection_physics(path_integral, I0=1.0,
+                             kVp=30.0,
+                             exposure_time=1.0,
+                             filtration_mmAl=0.0,
+                             grid_ratio=1.0,
+                             out=None):
+    """
+    Energy scaling, filtration, Beer–Lambert, exposure and grid on line integrals of any shape;
+    stacking several profiles as rows runs the whole chain (and its exp) once for all of them.
+    out as in np.multiply: pass out=path_integral when the caller owns that buffer.
+    """
+    # The exponent writes the one output buffer (by default a new one, since the input may be a
+    # shared, cached profile); every later step runs in place on it.
+    I = _attenuation_exponent(path_integral, kVp, filtration_mmAl, out=out)
+    np.exp(I, out=I)
+    I *= _detector_gain(exposure_time, grid_ratio, I0)
+
+    return I
 
 
 def simulate_projection(phantom, I0=1.0,
@@ -121,19 +252,10 @@ def simulate_projection(phantom, I0=1.0,
     1D vertical projection with magnification and Beer–Lambert physics.
     Params: phantom, I0, sid, sdd, kVp, exposure_time, filtration_mmAl, grid_ratio.
     """
-    mag_phantom = _apply_magnification(phantom, sid, sdd)
-
-    path_integral = np.sum(mag_phantom, axis=0)
-
-    path_integral = _apply_energy_scaling(path_integral, kVp)
-    path_integral = _apply_filtration(path_integral, filtration_mmAl, kVp)
-
-    I = I0 * np.exp(-path_integral)
-
-    I = _apply_exposure(I, exposure_time)
-    I = _apply_grid(I, grid_ratio)
-
-    return I
+    path_integral = projection_path_integral(phantom, None, sid, sdd)
+    return apply_projection_physics(
+        path_integral, I0, kVp, exposure_time, filtration_mmAl, grid_ratio
+    )
 
 
 def simulate_projection_angle(phantom, angle_deg, I0=1.0,
@@ -145,124 +267,134 @@ def simulate_projection_angle(phantom, angle_deg, I0=1.0,
     """
     Angled projection with rotation, magnification, energy/filtration, exposure, grid.
     Params: phantom, angle_deg, I0, sid, sdd, kVp, exposure_time, filtration_mmAl, grid_ratio.
+    Returns (I, rotated_mag); rotated_mag is always the caller's own array.
     """
-    rotated = rotate(phantom, angle=angle_deg, resize=False, mode='edge')
+    phantom = _as_float32(phantom)
+    rotated = _rotated(phantom, angle_deg)
     rotated_mag = _apply_magnification(rotated, sid, sdd)
 
     path_integral = np.sum(rotated_mag, axis=0)
+    I = apply_projection_physics(
+        path_integral, I0, kVp, exposure_time, filtration_mmAl, grid_ratio
+    )
 
-    path_integral = _apply_energy_scaling(path_integral, kVp)
-    path_integral = _apply_filtration(path_integral, filtration_mmAl, kVp)
-
-    I = I0 * np.exp(-path_integral)
-    I = _apply_exposure(I, exposure_time)
-    I = _apply_grid(I, grid_ratio)
-
+    if rotated_mag is rotated:
+        # At M=1 no magnification ran: copy rather than hand out the read-only cache entry.
+        rotated_mag = rotated_mag.copy()
     return I, rotated_mag
 
 
-def simulate_2d_projection(phantom, angles_deg, I0=1.0):
+def _map_angle_chunks(fn, angles):
     """
-    Compute a 2D Radon sinogram:
-    Each row = projection at one angle
-    Each column = detector pixel
-    Params: phantom, angles_deg (iterable), I0 incident intensity.
+    Run fn(chunk, sl) on per-CPU contiguous chunks of angles in threads (skimage's warp releases the GIL),
+    where sl is the chunk's slice of angles; returns the results in angle order.
     """
-    sinogram = []
-
-    for angle in angles_deg:
-        rotated = rotate(phantom, angle=angle, resize=False, mode='edge')
+    angles = np.asarray(angles, dtype=float)
+    workers = min(os.cpu_count() or 1, angles.size)
+    if workers <= 1:
+        return [fn(angles, slice(None))]
+    bounds = np.linspace(0, angles.size, workers + 1).astype(int)
+    slices = [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(lambda sl: fn(angles[sl], sl), slices))
+
+
+def _fill_angle_rows(fill, angles, width, dtype):
+    """Preallocate (n_angles, width) and let each _map_angle_chunks worker fill(chunk, rows) its own slice in place."""
+    angles = np.asarray(angles, dtype=float)
+    out = np.empty((angles.size, width), dtype=dtype)
+    _map_angle_chunks(lambda chunk, sl: fill(chunk, out[sl]), angles)
+    return out
 
-        projection = np.sum(rotated, axis=0)
 
-        I = I0 * np.exp(-projection)
+def _rotated_column_sums(phantom, angles_deg):
+    """Column sums of phantom rotated (edge mode) to each angle; only the (n_angles, ny) sums are kept."""
+    # One writable copy up front instead of one per angle inside _rotate_edge.
+    phantom = _warp_source(phantom)
 
-        sinogram.append(I)
+    def project(chunk, rows):
+        for k, angle in enumerate(chunk):
+            np.sum(_rotate_edge(phantom, angle), axis=0, out=rows[k])
 
-    return np.array(sinogram)
+    return _fill_angle_rows(project, angles_deg, phantom.shape[1], phantom.dtype)
 
-import numpy as np
-from skimage.transform import rotate
 
-def simulate_sinogram(
-        phantom,
-        max_angle_deg=180.0,
-        angle_step_deg=1.0,
-        I0=1.0,
-        sid=500.0,
-        sdd=1000.0,
-        kVp=30.0,
-        exposure_time=1.0,
-        filtration_mmAl=0.0,
-        grid_ratio=1.0,
-    ):
+def simulate_2d_projection(phantom, angles_deg, I0=1.0):
     """
-    Compute sinogram with magnification, energy/filtration, exposure, grid.
-    Params: phantom, max_angle_deg, angle_step_deg, I0, sid, sdd, kVp, exposure_time, filtration_mmAl, grid_ratio.
+    Compute a 2D Radon sinogram:
+    Each row = projection at one angle
+    Each column = detector pixel
+    Params: phantom, angles_deg (iterable), I0 incident intensity.
     """
+    phantom = _as_float32(phantom)
+    projection = _rotated_column_sums(phantom, angles_deg)
+    # The column-sum buffer is ours: apply Beer–Lambert to it in place, no temporaries.
+    np.negative(projection, out=projection)
+    np.exp(projection, out=projection)
+    projection *= I0
+    return projection
+
+
+def simulate_projection_angles(phantom, angles_deg, I0=1.0,
+                               sid=500.0, sdd=1000.0,
+                               kVp=30.0,
+                               exposure_time=1.0,
+                               filtration_mmAl=0.0,
+                               grid_ratio=1.0):
+    """
+    simulate_projection_angle over many angles: (n_angles, width) profiles, rotate+magnify+sum
+    threaded over angles, physics applied once to the stack.
+    Params: phantom, angles_deg (iterable), I0, sid, sdd, kVp, exposure_time, filtration_mmAl, grid_ratio.
+    """
+    phantom = _warp_source(_as_float32(phantom))
 
-    mag_phantom = _apply_magnification(phantom, sid, sdd)
-
-    if max_angle_deg <= 0:
-        max_angle_deg = 1.0
-    angles_deg = np.arange(0.0, max_angle_deg + 1e-6, angle_step_deg)
-
-    sinogram_rows = []
-
-    thickness_scale = 40.0
-
-    for ang in angles_deg:
-        rotated = rotate(mag_phantom, angle=ang, resize=False, mode="edge")
-
-        path_integral = np.sum(rotated, axis=0) / thickness_scale
-
-        path_integral = _apply_energy_scaling(path_integral, kVp)
-        path_integral = _apply_filtration(path_integral, filtration_mmAl, kVp)
-
-        I = I0 * np.exp(-path_integral)
-
-        I = _apply_exposure(I, exposure_time)
-        I = _apply_grid(I, grid_ratio)
-
-        sinogram_rows.append(I)
-
-    sinogram = np.array(sinogram_rows)
-
-    sinogram = np.clip(sinogram, 0.0, 1.0)
+    def project(chunk, rows):
+        for k, angle in enumerate(chunk):
+            rotated = _rotate_edge(phantom, angle)
+            np.sum(_apply_magnification(rotated, sid, sdd), axis=0, out=rows[k])
 
-    return sinogram, angles_deg
+    path_integrals = _fill_angle_rows(project, angles_deg, phantom.shape[1], phantom.dtype)
+    return apply_projection_physics(
+        path_integrals, I0, kVp, exposure_time, filtration_mmAl, grid_ratio, out=path_integrals
+    )
 
 
-from skimage.transform import radon
+def _parallel_radon(image, theta):
+    """Radon transform with theta split across threads; angles are independent."""
+    parts = _map_angle_chunks(lambda chunk, sl: radon(image, theta=chunk, circle=False), theta)
+    return parts[0] if len(parts) == 1 else np.concatenate(parts, axis=1)
 
 def simulate_projection_single(phantom, angle_deg, sid, sdd, kVp, exposure, filtration, grid_ratio=1.0):
     """Single-angle Radon projection expanded to 2D for display. Params: phantom, angle_deg, sid, sdd, kVp, exposure, filtration, grid_ratio."""
-    mag = _apply_magnification(phantom, sid, sdd)
+    phantom = _as_float32(phantom)
+    mag = _apply_magnification(phantom, sid, sdd, cache=True)
 
     theta = [angle_deg]
     sinogram = radon(mag, theta=theta, circle=False)
 
-    proj = sinogram[:, 0]
+    # radon's output is ours, so the physics runs in place on its single column.
+    I = sinogram[:, 0]
 
-    proj = _apply_energy_scaling(proj, kVp)
-    proj = _apply_filtration(proj, filtration, kVp)
-    I = np.exp(-proj)
-    I = _apply_exposure(I, exposure)
-    I = _apply_grid(I, grid_ratio)
+    _attenuation_exponent(I, kVp, filtration, out=I)
+    np.exp(I, out=I)
+    I *= _detector_gain(exposure, grid_ratio)
 
-    img = np.tile(I, (phantom.shape[0], 1))
-    return np.clip(img, 0, 1)
+    # Clip the profile once, then broadcast it down the rows: one write per pixel, no tiled temporary.
+    _clip_unit(I)
+    img = np.empty((phantom.shape[0], I.size), dtype=I.dtype)
+    img[...] = I
+    return img
 
 def simulate_sinogram(phantom, max_angle, sid, sdd, kVp, exposure, filtration, grid_ratio=1.0):
     """Legacy sinogram builder using Radon on magnified phantom. Params: phantom, max_angle, sid, sdd, kVp, exposure, filtration, grid_ratio."""
-    mag = _apply_magnification(phantom, sid, sdd)
+    phantom = _as_float32(phantom)
+    mag = _apply_magnification(phantom, sid, sdd, cache=True)
     angles = np.arange(0, max_angle + 1, 1)
-    sino = radon(mag, theta=angles, circle=False)
+    sino = _parallel_radon(mag, angles)
 
-    sino = _apply_energy_scaling(sino, kVp)
-    sino = _apply_filtration(sino, filtration, kVp)
-    sino = np.exp(-sino)
-    sino = _apply_exposure(sino, exposure)
-    sino = _apply_grid(sino, grid_ratio=grid_ratio)
+    # radon hands back a fresh (det, n_angles) array, so the whole chain runs in place on it.
+    _attenuation_exponent(sino, kVp, filtration, out=sino)
+    np.exp(sino, out=sino)
+    sino *= _detector_gain(exposure, grid_ratio)
 
-    return np.clip(sino, 0, 1), angles
+    return _clip_unit(sino), angles
@@ -13,24 +13,23 @@ def rotate_image_nn(image: np.ndarray, theta_deg: float) -> np.ndarray:
     cx = (nx - 1) / 2.0
     cy = (ny - 1) / 2.0
 
-    x_out, y_out = np.indices((nx, ny))
-    x_out_c = x_out - cx
-    y_out_c = y_out - cy
+    # Open (nx, 1) / (1, ny) offsets: only the source coordinates are full-size.
+    x_out_c = np.arange(nx)[:, None] - cx
+    y_out_c = np.arange(ny)[None, :] - cy
 
-    x_in_c = cos_t * x_out_c + sin_t * y_out_c
-    y_in_c = -sin_t * x_out_c + cos_t * y_out_c
-
-    x_in = np.round(x_in_c + cx).astype(int)
-    y_in = np.round(y_in_c + cy).astype(int)
-
-    rotated = np.zeros_like(image)
+    x_in = np.round(cos_t * x_out_c + sin_t * y_out_c + cx).astype(np.intp)
+    y_in = np.round(-sin_t * x_out_c + cos_t * y_out_c + cy).astype(np.intp)
 
     inside = (
         (x_in >= 0) & (x_in < nx) &
         (y_in >= 0) & (y_in < ny)
     )
 
-    rotated[inside] = image[x_in[inside], y_in[inside]]
+    # One clamped gather, then zero whatever fell outside the source.
+    np.clip(x_in, 0, nx - 1, out=x_in)
+    np.clip(y_in, 0, ny - 1, out=y_in)
+    rotated = image[x_in, y_in]
+    rotated[~inside] = 0
     return rotated
 
 
@@ -46,22 +45,14 @@ def apply_magnification(phantom: np.ndarray,
     cx = (nx - 1) / 2.0
     cy = (ny - 1) / 2.0
 
-    x_out, y_out = np.indices((nx, ny))
-    x_out_c = x_out - cx
-    y_out_c = y_out - cy
-
-    x_in_c = x_out_c / M
-    y_in_c = y_out_c / M
-
-    x_in = np.round(x_in_c + cx).astype(int)
-    y_in = np.round(y_in_c + cy).astype(int)
+    # Scaling is separable: each output row/column reads one source row/column.
+    x_in = np.round((np.arange(nx) - cx) / M + cx).astype(np.intp)
+    y_in = np.round((np.arange(ny) - cy) / M + cy).astype(np.intp)
+    x_ok = (x_in >= 0) & (x_in < nx)
+    y_ok = (y_in >= 0) & (y_in < ny)
 
     mag = np.zeros_like(phantom)
-    inside = (
-        (x_in >= 0) & (x_in < nx) &
-        (y_in >= 0) & (y_in < ny)
-    )
-    mag[inside] = phantom[x_in[inside], y_in[inside]]
+    mag[np.ix_(x_ok, y_ok)] = phantom[np.ix_(x_in[x_ok], y_in[y_ok])]
     return mag
 
 
@@ -92,8 +83,11 @@ def apply_exposure(I: np.ndarray,
 
 
 def roi_mean_std(image: np.ndarray, mask: np.ndarray):
-    """Return mean/std within boolean mask; nan if mask empty."""
-    masked = image[mask]
+    """Return mean/std within boolean mask or flat index array; nan if ROI empty."""
+    if mask.dtype == bool:
+        masked = image[mask]
+    else:
+        masked = image.ravel().take(mask)
     if masked.size == 0:
         return float("nan"), float("nan")
     return float(masked.mean()), float(masked.std())
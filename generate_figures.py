@@ -19,12 +19,14 @@ from ProjectFunctions.utils import roi_mean_std, roi_contrast
 
 FIG_DIR = Path("figs")
 FIG_DIR.mkdir(exist_ok=True)
+FIG_DPI = int(os.environ.get("FIG_DPI", "200"))
 
 
 def save_fig(name):
-    """Save current Matplotlib figure to figs/name (png)."""
+    """Save current Matplotlib figure to figs/name (png); set FIG_DPI=150 for quick drafts."""
     path = FIG_DIR / name
-    plt.savefig(path, bbox_inches="tight", dpi=200)
+    # Figure.savefig skips the extra full redraw pyplot.savefig does afterwards.
+    plt.gcf().savefig(path, bbox_inches="tight", dpi=FIG_DPI)
     print(f"saved {path}")
 
 
@@ -32,6 +34,7 @@ def baseline_and_variations():
     """Generate baseline radiograph and parameter variation figures; print ROI stats."""
     phantom, info = create_breast_phantom()
     params = dict(sid=500, sdd=1000, kVp=35, exposure_time=1.0, filtration_mmAl=2.0, grid_ratio=0.9)
+    params_no_dist = {k: v for k, v in params.items() if k not in ("sid", "sdd")}
 
     plt.figure(figsize=(6, 6))
     plt.imshow(phantom, cmap="magma")
@@ -48,8 +51,8 @@ def baseline_and_variations():
     save_fig("baseline_radiograph.png")
     plt.close()
 
-    img_sid_near = simulate_xray_2d(phantom, angle_deg=0, sid=350, sdd=1000, **{k: v for k, v in params.items() if k not in ["sid", "sdd"]})
-    img_sid_far = simulate_xray_2d(phantom, angle_deg=0, sid=700, sdd=1000, **{k: v for k, v in params.items() if k not in ["sid", "sdd"]})
+    img_sid_near = simulate_xray_2d(phantom, angle_deg=0, sid=350, sdd=1000, **params_no_dist)
+    img_sid_far = simulate_xray_2d(phantom, angle_deg=0, sid=700, sdd=1000, **params_no_dist)
     plt.figure(figsize=(12, 4))
     for i, (im, title) in enumerate([
         (img0, "Baseline (SID 500)"),
@@ -89,7 +92,7 @@ def baseline_and_variations():
     plt.close()
 
     baseline_profile = simulate_projection(phantom, I0=1.0, **params)
-    dist_near = simulate_projection(phantom, I0=1.0, sid=350, sdd=1000, **{k: v for k, v in params.items() if k not in ["sid", "sdd"]})
+    dist_near = simulate_projection(phantom, I0=1.0, sid=350, sdd=1000, **params_no_dist)
     dense_profile = simulate_projection(dense_phantom, I0=1.0, **params)
     angle_profile, _ = simulate_projection_angle(phantom, angle_deg=20, I0=1.0, **params)
 
@@ -121,8 +124,8 @@ def baseline_and_variations():
     plt.close()
 
     def roi_stats(p, info_local, label):
-        lesion_mean, lesion_std = roi_mean_std(p, info_local["lesion_mask"])
-        bg_mean, bg_std = roi_mean_std(p, info_local["background_mask"])
+        lesion_mean, lesion_std = roi_mean_std(p, info_local["lesion_idx"])
+        bg_mean, bg_std = roi_mean_std(p, info_local["background_idx"])
         contrast = roi_contrast(lesion_mean, bg_mean)
         print(f"{label}: lesion {lesion_mean:.3f}±{lesion_std:.3f}, bg {bg_mean:.3f}±{bg_std:.3f}, contrast {contrast:.2f}")
         return lesion_mean, lesion_std, bg_mean, bg_std, contrast
@@ -5,6 +5,7 @@ from ProjectFunctions.phantom import create_shepp_logan
 from ProjectFunctions.simulate_xray import (
     simulate_projection,
     simulate_projection_angle,
+    simulate_projection_angles,
     simulate_2d_projection
 )
 
@@ -118,17 +119,17 @@ def test_angles(phantom):
     angles = [0, 15, 30, 45, 60]
     plt.figure(figsize=(10, 5))
 
-    for a in angles:
-        I, _ = simulate_projection_angle(
-            phantom,
-            a,
-            I0=1.0,
-            sid=500,
-            sdd=1000,
-            kVp=30,
-            exposure_time=1.0,
-            filtration_mmAl=2.0
-        )
+    profiles = simulate_projection_angles(
+        phantom,
+        angles,
+        I0=1.0,
+        sid=500,
+        sdd=1000,
+        kVp=30,
+        exposure_time=1.0,
+        filtration_mmAl=2.0
+    )
+    for a, I in zip(angles, profiles):
         plt.plot(I, label=f"{a}°")
 
     plt.title("Projection Profiles at Different Angles")